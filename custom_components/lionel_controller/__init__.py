@@ -3,29 +3,45 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from bleak import BleakClient, BleakError
+from bleak.backends.device import BLEDevice
 from bleak_retry_connector import establish_connection, BleakClientWithServiceCache
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth import BluetoothServiceInfoBleak, BluetoothChange
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CMD_MASTER_VOLUME,
-    CMD_SMOKE,
     CMD_SOUND_VOLUME,
+    COMMANDS,
     CONF_MAC_ADDRESS,
     CONF_SERVICE_UUID,
     DEFAULT_RETRY_COUNT,
     DEFAULT_TIMEOUT,
     DEVICE_INFO_SERVICE_UUID,
+    DISCONNECT_COMMAND,
     DOMAIN,
     FIRMWARE_REVISION_CHAR_UUID,
     HARDWARE_REVISION_CHAR_UUID,
+    IDLE_DISCONNECT_TIMEOUT,
     LIONCHIEF_SERVICE_UUID,
     MANUFACTURER_NAME_CHAR_UUID,
     MODEL_NUMBER_CHAR_UUID,
@@ -36,6 +52,9 @@ from .const import (
     SOUND_SOURCE_ENGINE,
     SOUND_SOURCE_HORN,
     SOUND_SOURCE_SPEECH,
+    SPEED_COMMANDS,
+    SPEED_HEX,
+    STORAGE_VERSION,
     WRITE_CHARACTERISTIC_UUID,
     build_command,
     build_simple_command,
@@ -45,20 +64,59 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.NUMBER, Platform.SWITCH, Platform.BUTTON, Platform.BINARY_SENSOR, Platform.SENSOR]
 
+# Lowercased once at import; bleak already reports lowercase UUIDs
+_LIONEL_UUIDS: frozenset[str] = frozenset({LIONCHIEF_SERVICE_UUID.lower()})
+
+# Device Information characteristic -> coordinator attribute
+_DEVICE_INFO_CHARS: dict[str, str] = {
+    MODEL_NUMBER_CHAR_UUID: "_model_number",
+    SERIAL_NUMBER_CHAR_UUID: "_serial_number",
+    FIRMWARE_REVISION_CHAR_UUID: "_firmware_revision",
+    HARDWARE_REVISION_CHAR_UUID: "_hardware_revision",
+    SOFTWARE_REVISION_CHAR_UUID: "_software_revision",
+    MANUFACTURER_NAME_CHAR_UUID: "_manufacturer_name",
+}
+
+# Delays between force-reconnect attempts, in seconds
+_RECONNECT_BACKOFF: tuple[float, ...] = (1.0, 2.0, 4.0, 8.0)
+
+# Packed on/off state bits. Lights and bell use the same bit positions as the
+# flags byte of the status frame so it can be merged in directly.
+_FLAG_BELL = 0x02
+_FLAG_LIGHTS = 0x04
+_FLAG_HORN = 1 << 8
+_FLAG_SMOKE = 1 << 9
+_FLAG_DIRECTION_FORWARD = 1 << 10
+_STATUS_MASK = _FLAG_LIGHTS | _FLAG_BELL
+
+# State attribute name -> packed flag bit
+_FLAG_ATTRS: dict[str, int] = {
+    "direction_forward": _FLAG_DIRECTION_FORWARD,
+    "lights_on": _FLAG_LIGHTS,
+    "horn_on": _FLAG_HORN,
+    "bell_on": _FLAG_BELL,
+    "smoke_on": _FLAG_SMOKE,
+}
+
+# Attributes touched by a notification, with and without a parsed status frame
+_NOTIFY_ATTRS = ("last_notification_hex",)
+_STATUS_ATTRS = (
+    "last_notification_hex",
+    "speed",
+    "direction_forward",
+    "lights_on",
+    "bell_on",
+)
+
 
 @callback
 def _async_discovered_device(
     service_info: BluetoothServiceInfoBleak, change: BluetoothChange
 ) -> bool:
     """Check if discovered device is a Lionel LionChief locomotive."""
-    if change != BluetoothChange.ADVERTISEMENT:
-        return False
-    
     # Check for Lionel LionChief service UUID
-    lionel_service_uuid = LIONCHIEF_SERVICE_UUID.lower()
-    return any(
-        service_uuid.lower() == lionel_service_uuid
-        for service_uuid in service_info.service_uuids
+    return change == BluetoothChange.ADVERTISEMENT and not _LIONEL_UUIDS.isdisjoint(
+        service_info.service_uuids
     )
 
 
@@ -105,9 +163,89 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached device information of a deleted config entry."""
+    await _device_info_store(hass, entry.data[CONF_MAC_ADDRESS]).async_remove()
+
+
+def _device_info_store(hass: HomeAssistant, mac_address: str) -> Store[dict[str, str]]:
+    """Return the store holding cached device information for a train."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{mac_address}")
+
+
+@dataclass(frozen=True, slots=True)
+class TrainState:
+    """Immutable snapshot of the train state read by entities."""
+
+    speed: int
+    direction_forward: bool
+    lights_on: bool
+    horn_on: bool
+    bell_on: bool
+    smoke_on: bool
+    master_volume: int
+    horn_volume: int
+    bell_volume: int
+    speech_volume: int
+    engine_volume: int
+    last_notification_hex: str | None
+
+
 class LionelTrainCoordinator:
     """Coordinator for managing the Lionel train connection."""
 
+    __slots__ = (
+        "hass",
+        "mac_address",
+        "name",
+        "service_uuid",
+        "_client",
+        "_store",
+        "_device_info_cached",
+        "_connected",
+        "_write_response",
+        "_idle_handle",
+        "_idle_released",
+        "_lock",
+        "_retry_count",
+        "signal_update",
+        "state",
+        "_speed",
+        "_pending_speed",
+        "_speed_write_active",
+        "_speed_step",
+        "_flags",
+        "_master_volume",
+        "_horn_volume",
+        "_bell_volume",
+        "_speech_volume",
+        "_engine_volume",
+        "_horn_pitch",
+        "_bell_pitch",
+        "_speech_pitch",
+        "_engine_pitch",
+        "_model_number",
+        "_serial_number",
+        "_firmware_revision",
+        "_hardware_revision",
+        "_software_revision",
+        "_manufacturer_name",
+        "_device_info_dict",
+        "shared_device_info",
+        "_discovered_write_char",
+        "_discovered_notify_char",
+        "_discovered_lionchief_service",
+        "_last_notification_hex",
+    )
+
+    # Sound source -> (volume state attribute, pitch attribute)
+    _SOUND_ATTRS: dict[int, tuple[str, str]] = {
+        SOUND_SOURCE_HORN: ("horn_volume", "_horn_pitch"),
+        SOUND_SOURCE_BELL: ("bell_volume", "_bell_pitch"),
+        SOUND_SOURCE_SPEECH: ("speech_volume", "_speech_pitch"),
+        SOUND_SOURCE_ENGINE: ("engine_volume", "_engine_pitch"),
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -121,17 +259,26 @@ class LionelTrainCoordinator:
         self.name = name
         self.service_uuid = service_uuid
         self._client: BleakClientWithServiceCache | None = None
+        self._store = _device_info_store(hass, mac_address)
+        self._device_info_cached = False
         self._connected = False
+        # Whether writes need a response; refined from the characteristic on connect
+        self._write_response = True
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._idle_released = False
         self._lock = asyncio.Lock()
         self._retry_count = 0
-        self._update_callbacks = set()
+        self.signal_update = f"{DOMAIN}_{mac_address}_update"
         
         # State tracking
         self._speed = 0
-        self._direction_forward = True
-        self._lights_on = True  # Default to on since locomotive lights are on when reconnected
-        self._horn_on = False
-        self._bell_on = False
+        # Latest requested speed not yet sent, for coalescing slider drags
+        self._pending_speed: int | None = None
+        self._speed_write_active = False
+        # Last 0-31 speed step known to be on the train; None when unknown
+        self._speed_step: int | None = None
+        # Forward with lights on, since locomotive lights are on when reconnected
+        self._flags = _FLAG_DIRECTION_FORWARD | _FLAG_LIGHTS
         
         # Advanced feature state tracking
         self._master_volume = 5  # Default mid-range volume
@@ -144,8 +291,6 @@ class LionelTrainCoordinator:
         self._speech_pitch = 0
         self._engine_pitch = 0
         
-        self._smoke_on = False
-        
         # Device information
         self._model_number = None
         self._serial_number = None
@@ -153,6 +298,7 @@ class LionelTrainCoordinator:
         self._hardware_revision = None
         self._software_revision = None
         self._manufacturer_name = None
+        self._update_device_info()
         
         # Dynamic characteristic discovery
         self._discovered_write_char = None
@@ -162,10 +308,28 @@ class LionelTrainCoordinator:
         # Status information
         self._last_notification_hex = None
 
+        self.state = self._build_state()
+
     @property
     def connected(self) -> bool:
         """Return True if connected to the train."""
-        return self._connected and self._client is not None and self._client.is_connected
+        # Kept in sync on connect, on our own disconnects and by bleak's
+        # disconnected callback, so no need to ask the client every time
+        return self._connected
+
+    @property
+    def available(self) -> bool:
+        """Return True if the train can take commands.
+
+        A link released for inactivity is reopened by the next command, so the
+        train stays available while idle.
+        """
+        return self._idle_released or self.connected
+
+    @property
+    def idle_released(self) -> bool:
+        """Return True while the link is released and notifications are paused."""
+        return self._idle_released
 
     @property
     def speed(self) -> int:
@@ -175,22 +339,22 @@ class LionelTrainCoordinator:
     @property
     def direction_forward(self) -> bool:
         """Return True if direction is forward."""
-        return self._direction_forward
+        return bool(self._flags & _FLAG_DIRECTION_FORWARD)
 
     @property
     def lights_on(self) -> bool:
         """Return True if lights are on."""
-        return self._lights_on
+        return bool(self._flags & _FLAG_LIGHTS)
 
     @property
     def horn_on(self) -> bool:
         """Return True if horn is on."""
-        return self._horn_on
+        return bool(self._flags & _FLAG_HORN)
 
     @property
     def bell_on(self) -> bool:
         """Return True if bell is on."""
-        return self._bell_on
+        return bool(self._flags & _FLAG_BELL)
 
     # Advanced feature properties
     @property
@@ -221,42 +385,132 @@ class LionelTrainCoordinator:
     @property
     def smoke_on(self) -> bool:
         """Return True if smoke unit is on."""
-        return self._smoke_on
+        return bool(self._flags & _FLAG_SMOKE)
 
     @property
     def last_notification_hex(self) -> str | None:
         """Return the last notification hex string."""
         return self._last_notification_hex
 
+    def unique_id(self, key: str) -> str:
+        """Return the unique ID of this train's entity with the given key."""
+        return f"{self.mac_address}_{key}"
+
     @property
     def device_info(self) -> dict:
         """Return device information."""
-        return {
+        return self._device_info_dict
+
+    def _update_device_info(self) -> None:
+        """Rebuild the cached device information."""
+        self._device_info_dict = {
             "model": self._model_number or "LionChief Locomotive",
             "manufacturer": self._manufacturer_name or "Lionel",
             "sw_version": self._software_revision or "Unknown",
             "hw_version": self._hardware_revision or "Unknown", 
             "serial_number": self._serial_number,
         }
+        # One DeviceInfo shared by reference across every entity of this train
+        self.shared_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.mac_address)},
+            name=self.name,
+            **self._device_info_dict,
+        )
 
-    def add_update_callback(self, callback):
-        """Add a callback to be called when the state changes."""
-        self._update_callbacks.add(callback)
+    def _set_flag(self, flag: int, on: bool) -> None:
+        """Set or clear a packed state flag."""
+        if on:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
 
-    def remove_update_callback(self, callback):
-        """Remove a callback."""
-        self._update_callbacks.discard(callback)
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: Callable[[], None],
+        attrs: tuple[str, ...] | None = None,
+    ) -> Callable[[], None]:
+        """Listen for state changes and return a function that stops listening.
 
-    def _notify_state_change(self):
-        """Notify all registered callbacks of state changes."""
-        for callback in self._update_callbacks:
-            try:
-                callback()
-            except Exception as err:
-                _LOGGER.error("Error calling update callback: %s", err)
+        If attrs is given, update_callback only runs when one of those state
+        attributes changes or when all entities are refreshed.
+        """
+        if attrs is None:
+
+            @callback
+            def _async_update(changed: tuple[str, ...] | None) -> None:
+                update_callback()
+
+        else:
+            watched = frozenset(attrs)
+
+            @callback
+            def _async_update(changed: tuple[str, ...] | None) -> None:
+                if changed is None or not watched.isdisjoint(changed):
+                    update_callback()
+
+        return async_dispatcher_connect(self.hass, self.signal_update, _async_update)
+
+    def _update_and_notify(self, attr: str, value: Any) -> None:
+        """Update one state attribute and notify the callbacks interested in it."""
+        flag = _FLAG_ATTRS.get(attr)
+        if flag is not None:
+            self._set_flag(flag, value)
+        else:
+            setattr(self, f"_{attr}", value)
+        self._notify_state_change((attr,), only_if_changed=True)
+
+    def _build_state(self) -> TrainState:
+        """Build a snapshot of the current train state."""
+        flags = self._flags
+        return TrainState(
+            speed=self._speed,
+            direction_forward=bool(flags & _FLAG_DIRECTION_FORWARD),
+            lights_on=bool(flags & _FLAG_LIGHTS),
+            horn_on=bool(flags & _FLAG_HORN),
+            bell_on=bool(flags & _FLAG_BELL),
+            smoke_on=bool(flags & _FLAG_SMOKE),
+            master_volume=self._master_volume,
+            horn_volume=self._horn_volume,
+            bell_volume=self._bell_volume,
+            speech_volume=self._speech_volume,
+            engine_volume=self._engine_volume,
+            last_notification_hex=self._last_notification_hex,
+        )
+
+    def _notify_state_change(
+        self, attrs: tuple[str, ...] | None = None, *, only_if_changed: bool = False
+    ) -> None:
+        """Refresh the state snapshot and signal state changes to entities.
+
+        Without attrs every listener runs; otherwise only listeners for all
+        changes or for one of the given attributes. With only_if_changed,
+        attrs is narrowed to the TrainState fields whose value differs from
+        the previous snapshot, and nothing is signalled if none do.
+        """
+        state = self._build_state()
+        if only_if_changed:
+            previous = self.state
+            attrs = tuple(
+                attr
+                for attr in attrs
+                if getattr(state, attr) != getattr(previous, attr)
+            )
+            if not attrs:
+                return
+        self.state = state
+        async_dispatcher_send(self.hass, self.signal_update, attrs)
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
+        # Device information never changes, reuse it from previous connects
+        if cached := await self._store.async_load():
+            for attr_name in _DEVICE_INFO_CHARS.values():
+                if value := cached.get(attr_name):
+                    setattr(self, attr_name, value)
+            self._device_info_cached = True
+            self._update_device_info()
+
         try:
             await self._async_connect()
         except (BleakError, asyncio.TimeoutError) as err:
@@ -266,6 +520,9 @@ class LionelTrainCoordinator:
 
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
         if self._client and self._client.is_connected:
             await self._client.disconnect()
         self._connected = False
@@ -273,111 +530,184 @@ class LionelTrainCoordinator:
     async def _async_connect(self) -> None:
         """Connect to the train."""
         async with self._lock:
-            if self._connected:
-                return
+            await self._async_connect_locked()
+
+    async def _async_connect_locked(self) -> None:
+        """Connect to the train; the caller must hold self._lock."""
+        if self._connected:
+            return
+
+        # Get a fresh BLE device reference
+        ble_device = await self._async_get_ble_device()
 
-            # Get a fresh BLE device reference
-            ble_device = bluetooth.async_ble_device_from_address(
-                self.hass, self.mac_address, connectable=True
+        try:
+            _LOGGER.debug("Establishing connection to %s", self.mac_address)
+            self._client = await establish_connection(
+                BleakClientWithServiceCache,
+                ble_device,
+                self.mac_address,
+                disconnected_callback=self._on_disconnected,
+                max_attempts=3,
             )
-            
-            if not ble_device:
-                # Try to scan for the device if not found in cache
-                _LOGGER.debug("Device not found in cache, attempting fresh lookup")
-                await asyncio.sleep(0.5)  # Brief delay before retry
-                ble_device = bluetooth.async_ble_device_from_address(
-                    self.hass, self.mac_address, connectable=True
-                )
-                
-            if not ble_device:
-                raise BleakError(f"Could not find Bluetooth device with address {self.mac_address}")
 
+            # Fall back to acknowledged writes if the train does not accept
+            # write without response on the command characteristic
+            write_char = self._client.services.get_characteristic(WRITE_CHARACTERISTIC_UUID)
+            self._write_response = (
+                write_char is None or "write-without-response" not in write_char.properties
+            )
+            
+            # Read device information if available
+            await self._read_device_info()
+            
+            # Log all BLE services and characteristics for debugging; this
+            # reads every readable characteristic, so only do it when needed
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                await self._log_ble_characteristics()
+            
+            # Set up notification handler for status updates
             try:
-                _LOGGER.debug("Establishing connection to %s", self.mac_address)
-                self._client = await establish_connection(
-                    BleakClientWithServiceCache,
-                    ble_device,
-                    self.mac_address,
-                    max_attempts=3,
+                # Always use the known-good notify characteristic UUID
+                notify_char_uuid = NOTIFY_CHARACTERISTIC_UUID
+                await self._client.start_notify(
+                    notify_char_uuid, self._notification_handler
                 )
-                
-                # Read device information if available
-                await self._read_device_info()
-                
-                # Log all BLE services and characteristics for debugging
-                await self._log_ble_characteristics()
-                
-                # Set up notification handler for status updates
-                try:
-                    # Always use the known-good notify characteristic UUID
-                    notify_char_uuid = NOTIFY_CHARACTERISTIC_UUID
-                    await self._client.start_notify(
-                        notify_char_uuid, self._notification_handler
-                    )
-                    _LOGGER.info("📡 Set up notifications on %s", notify_char_uuid)
-                except BleakError as err:
-                    _LOGGER.debug("Could not set up notifications (train may not support them): %s", err)
-                
-                self._connected = True
-                self._retry_count = 0
-                _LOGGER.info("Connected to Lionel train at %s", self.mac_address)
-
+                _LOGGER.info("📡 Set up notifications on %s", notify_char_uuid)
             except BleakError as err:
-                _LOGGER.error("Failed to connect to train: %s", err)
-                self._connected = False
-                raise
+                _LOGGER.debug("Could not set up notifications (train may not support them): %s", err)
+            
+            self._connected = True
+            self._idle_released = False
+            self._retry_count = 0
+            self._speed_step = None
+            _LOGGER.info("Connected to Lionel train at %s", self.mac_address)
+            self._notify_state_change(("connected",))
+            # Release the link even if no command ever follows the connect
+            self._schedule_idle_disconnect()
+
+        except BleakError as err:
+            _LOGGER.error("Failed to connect to train: %s", err)
+            self._connected = False
+            raise
+
+    @callback
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Handle the train dropping the BLE link."""
+        # Ignore clients we already replaced or released ourselves
+        if client is not self._client:
+            return
+        _LOGGER.debug("Disconnected from %s", self.mac_address)
+        self._connected = False
+        self._notify_state_change(("connected",))
+
+    async def _async_get_ble_device(self) -> BLEDevice:
+        """Return a connectable BLE device, waiting briefly for it to advertise."""
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, self.mac_address, connectable=True
+        )
+        if ble_device:
+            return ble_device
+
+        # Not in the cache yet, wake up as soon as the device advertises
+        _LOGGER.debug("Device not found in cache, waiting for advertisement")
+        discovery_event = asyncio.Event()
+
+        @callback
+        def _async_device_seen(
+            service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+        ) -> None:
+            discovery_event.set()
+
+        cancel = bluetooth.async_register_callback(
+            self.hass,
+            _async_device_seen,
+            BluetoothCallbackMatcher(address=self.mac_address, connectable=True),
+            BluetoothScanningMode.ACTIVE,
+        )
+        try:
+            await asyncio.wait_for(discovery_event.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            cancel()
+
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, self.mac_address, connectable=True
+        )
+        if not ble_device:
+            raise BleakError(f"Could not find Bluetooth device with address {self.mac_address}")
+        return ble_device
 
     async def _notification_handler(self, sender: int, data: bytearray) -> None:
         """Handle notifications from the train."""
-        _LOGGER.debug("Received notification: %s", data.hex())
-        
         # Store the raw notification hex string
         self._last_notification_hex = data.hex()
-        
-        # Parse locomotive status data based on protocol analysis
-        if len(data) >= 8 and data[0] == 0x00 and data[1] == 0x81 and data[2] == 0x02:
-            # This is train status data: [0x00, 0x81, 0x02, speed, direction, 0x03, 0x0C, flags]
-            try:
-                self._speed = int((data[3] / 31) * 100)  # Convert 0-31 to 0-100%
-                self._direction_forward = data[4] == 0x01
-                
-                # Parse flags byte (data[7])
-                flags = data[7]
-                self._lights_on = (flags & 0x04) != 0
-                self._bell_on = (flags & 0x02) != 0
-                
-                _LOGGER.debug("Parsed train status: speed=%d%%, forward=%s, lights=%s, bell=%s", 
-                             self._speed, self._direction_forward, self._lights_on, self._bell_on)
-                
-                # Notify entities of state change
-                self._notify_state_change()
-                
-            except (IndexError, ValueError) as err:
-                _LOGGER.debug("Error parsing train status: %s", err)
+        _LOGGER.debug("Received notification: %s", self._last_notification_hex)
+
+        # Dispatch on the message prefix to the matching parser; slicing the
+        # memoryview avoids copying the payload
+        view = memoryview(data)
+        parser = _NOTIFY_PARSERS.get(bytes(view[:3]))
+        if parser is not None and len(view) >= parser[0]:
+            parser[1](self, view)
+            attrs = _STATUS_ATTRS
         else:
             # For any notification, notify state change to update the hex sensor
-            self._notify_state_change()
+            attrs = _NOTIFY_ATTRS
+
+        # Repeated frames while cruising leave the state untouched
+        self._notify_state_change(attrs, only_if_changed=True)
+
+    def _parse_status(self, data: memoryview) -> None:
+        """Parse train status data.
+
+        Layout: [0x00, 0x81, 0x02, speed, direction, 0x03, 0x0C, flags]
+        """
+        self._speed_step = data[3]
+        self._speed = (data[3] * 100) // 31  # Convert 0-31 to 0-100%
+        self._set_flag(_FLAG_DIRECTION_FORWARD, data[4] == 0x01)
+
+        # Merge the lights/bell bits of the flags byte (data[7])
+        self._flags = (self._flags & ~_STATUS_MASK) | (data[7] & _STATUS_MASK)
+
+        _LOGGER.debug("Parsed train status: speed=%d%%, forward=%s, lights=%s, bell=%s", 
+                     self._speed, self.direction_forward, self.lights_on, self.bell_on)
 
     async def _read_device_info(self) -> None:
         """Read device information characteristics."""
-        device_info_chars = {
-            MODEL_NUMBER_CHAR_UUID: "_model_number",
-            SERIAL_NUMBER_CHAR_UUID: "_serial_number", 
-            FIRMWARE_REVISION_CHAR_UUID: "_firmware_revision",
-            HARDWARE_REVISION_CHAR_UUID: "_hardware_revision",
-            SOFTWARE_REVISION_CHAR_UUID: "_software_revision",
-            MANUFACTURER_NAME_CHAR_UUID: "_manufacturer_name",
-        }
-        
-        for char_uuid, attr_name in device_info_chars.items():
-            try:
-                result = await self._client.read_gatt_char(char_uuid)
-                value = result.decode('utf-8', errors='ignore').strip()
-                if value:
-                    setattr(self, attr_name, value)
-                    _LOGGER.debug("Read %s: %s", attr_name, value)
-            except BleakError:
+        if self._device_info_cached:
+            return
+
+        device_info_chars = _DEVICE_INFO_CHARS
+
+        # Issue all reads at once so the ATT requests can be pipelined
+        results = await asyncio.gather(
+            *(self._client.read_gatt_char(char_uuid) for char_uuid in device_info_chars),
+            return_exceptions=True,
+        )
+
+        for (char_uuid, attr_name), result in zip(device_info_chars.items(), results):
+            if isinstance(result, BleakError):
                 _LOGGER.debug("Could not read characteristic %s", char_uuid)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            stripped = result.strip(b"\x00 \t\r\n")
+            if stripped:
+                value = stripped.decode('utf-8', errors='ignore')
+                setattr(self, attr_name, value)
+                _LOGGER.debug("Read %s: %s", attr_name, value)
+
+        # Cache what was read so later connects can skip these reads
+        device_info = {
+            attr_name: value
+            for attr_name in device_info_chars.values()
+            if (value := getattr(self, attr_name)) is not None
+        }
+        if device_info:
+            await self._store.async_save(device_info)
+            self._device_info_cached = True
+            self._update_device_info()
 
     async def _log_ble_characteristics(self) -> None:
         """Log all BLE services and characteristics for debugging and discover dynamic characteristics."""
@@ -488,15 +818,23 @@ class LionelTrainCoordinator:
             import traceback
             _LOGGER.error("Full traceback: %s", traceback.format_exc())
 
-    async def async_send_command(self, command_data: list[int]) -> bool:
-        """Send a command to the train."""
+    async def async_send_command(
+        self, command_data: bytes, response: bool = False
+    ) -> bool:
+        """Send a command to the train.
+
+        Commands are written without response when the train supports it;
+        pass response=True when the write must be acknowledged by the train.
+        """
         async with self._lock:
             # Try to connect if not connected
             if not self.connected:
                 try:
-                    await self._async_connect()
+                    await self._async_connect_locked()
                 except BleakError as err:
                     _LOGGER.error("Failed to connect before sending command: %s", err)
+                    self._idle_released = False
+                    self._notify_state_change(("connected",))
                     return False
 
             # Always use the known-good write characteristic UUID
@@ -507,173 +845,221 @@ class LionelTrainCoordinator:
             for attempt in range(max_retries):
                 try:
                     await self._client.write_gatt_char(
-                        write_char_uuid, bytearray(command_data)
+                        write_char_uuid,
+                        command_data,
+                        response=response or self._write_response,
                     )
-                    hex_string = ''.join(f'{b:02x}' for b in command_data)
-                    _LOGGER.info("✅ Sent command successfully to %s: %s (hex: %s)", 
-                               write_char_uuid, command_data, hex_string)
+                    hex_string = command_data.hex()
+                    _LOGGER.info("✅ Sent command successfully to %s (hex: %s)",
+                               write_char_uuid, hex_string)
                     
                     # Update the status sensor with the sent command
-                    self._last_notification_hex = hex_string
-                    self._notify_state_change()
+                    self._update_and_notify("last_notification_hex", hex_string)
+                    self._schedule_idle_disconnect()
                     
                     return True
 
                 except BleakError as err:
                     _LOGGER.warning("Failed to send command to %s (attempt %d/%d): %s", 
                                   write_char_uuid, attempt + 1, max_retries, err)
-                    self._connected = False
-                    
-                    # Try to reconnect on subsequent attempts
+
                     if attempt < max_retries - 1:
+                        # The link is still up, so just retry the write
+                        if self._client is not None and self._client.is_connected:
+                            continue
+
+                        # Only reconnect once the link is actually gone
+                        self._connected = False
+                        # establish_connection already backs off between its
+                        # own attempts, so reconnect right away
                         try:
-                            await asyncio.sleep(0.5 * (attempt + 1))  # Exponential backoff
-                            await self._async_connect()
+                            await self._async_connect_locked()
                         except BleakError:
                             _LOGGER.debug("Reconnection attempt %d failed", attempt + 1)
                             continue
                     else:
+                        self._connected = False
+                        self._idle_released = False
                         _LOGGER.error("Failed to send command after %d attempts: %s", max_retries, err)
+                        # Drop the link too, or the next connect leaks it
+                        client = self._client
+                        self._client = None
+                        if client is not None:
+                            try:
+                                await client.disconnect()
+                            except BleakError as disconnect_err:
+                                _LOGGER.debug("Error disconnecting failed client: %s", disconnect_err)
+                        self._notify_state_change(("connected",))
                         
             return False
 
+    def _schedule_idle_disconnect(self) -> None:
+        """Restart the timer that releases the link after inactivity."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        self._idle_handle = self.hass.loop.call_later(
+            IDLE_DISCONNECT_TIMEOUT, self._async_idle_timeout
+        )
+
+    @callback
+    def _async_idle_timeout(self) -> None:
+        """Handle the inactivity timer firing."""
+        self._idle_handle = None
+        self.hass.async_create_background_task(
+            self._async_idle_disconnect(), f"{DOMAIN} idle disconnect {self.mac_address}"
+        )
+
+    async def _async_idle_disconnect(self) -> None:
+        """Release the BLE link; the next command reconnects."""
+        async with self._lock:
+            # A command may have rescheduled the timer while we waited
+            if self._idle_handle is not None or not self.connected:
+                return
+            # Keep the link while the train is moving or sounding so status
+            # notifications keep flowing and a stop goes out without a reconnect
+            if self._speed or self._flags & (_FLAG_HORN | _FLAG_BELL):
+                self._schedule_idle_disconnect()
+                return
+            client = self._client
+            self._client = None
+            self._connected = False
+            self._idle_released = True
+
+        _LOGGER.debug("Releasing idle connection to %s", self.mac_address)
+        try:
+            await client.disconnect()
+        except BleakError as err:
+            _LOGGER.debug("Error disconnecting idle client: %s", err)
+        self._notify_state_change(("connected",))
+
     async def async_set_speed(self, speed: int) -> bool:
-        """Set train speed (0-100)."""
+        """Set train speed (0-100).
+
+        While a speed write is in flight, further calls only record the
+        requested speed and return; the in-flight caller then sends the latest
+        value, so intermediate slider positions are dropped.
+        """
         if not 0 <= speed <= 100:
             raise ValueError("Speed must be between 0 and 100")
-        
-        # Convert 0-100 to 0-31 (0x00-0x1F) hex scale
-        hex_speed = int((speed / 100) * 31)
-        command = build_simple_command(0x45, [hex_speed])
-        
-        success = await self.async_send_command(command)
-        if success:
-            self._speed = speed
-            self._notify_state_change()
+
+        self._pending_speed = speed
+        if self._speed_write_active:
+            return True
+
+        self._speed_write_active = True
+        success = False
+        try:
+            while (pending := self._pending_speed) is not None:
+                self._pending_speed = None
+                # The train only has 32 speed steps, so many throttle
+                # percentages map onto the step it is already running at
+                step = SPEED_HEX[pending]
+                if step == self._speed_step and self.connected:
+                    success = True
+                else:
+                    # Payload already scaled from 0-100 to 0-31 (0x00-0x1F)
+                    success = await self.async_send_command(SPEED_COMMANDS[pending])
+                if success:
+                    self._speed_step = step
+                    self._update_and_notify("speed", pending)
+        finally:
+            self._speed_write_active = False
         return success
 
+    async def _async_set_function(self, name: str, attr: str, on: bool) -> bool:
+        """Send an on/off command, showing the new state before the write.
+
+        Listeners see the requested state right away; it is rolled back if
+        the command cannot be delivered.
+        """
+        previous = getattr(self, attr)
+        self._update_and_notify(attr, on)
+        if await self.async_send_command(COMMANDS[name, on]):
+            return True
+        self._update_and_notify(attr, previous)
+        return False
+
     async def async_set_direction(self, forward: bool) -> bool:
         """Set train direction."""
-        direction_value = 0x01 if forward else 0x02
-        command = build_simple_command(0x46, [direction_value])
-        
-        success = await self.async_send_command(command)
-        if success:
-            self._direction_forward = forward
-        return success
+        return await self._async_set_function("direction", "direction_forward", forward)
 
     async def async_set_lights(self, on: bool) -> bool:
         """Set train lights."""
-        command = build_simple_command(0x51, [0x01 if on else 0x00])
-        success = await self.async_send_command(command)
-        if success:
-            self._lights_on = on
-        return success
+        return await self._async_set_function("lights", "lights_on", on)
 
     async def async_set_horn(self, on: bool) -> bool:
         """Set train horn."""
-        command = build_simple_command(0x48, [0x01 if on else 0x00])
-        success = await self.async_send_command(command)
-        if success:
-            self._horn_on = on
-        return success
+        return await self._async_set_function("horn", "horn_on", on)
 
     async def async_set_bell(self, on: bool) -> bool:
         """Set train bell."""
-        command = build_simple_command(0x47, [0x01 if on else 0x00])
-        success = await self.async_send_command(command)
-        if success:
-            self._bell_on = on
-        return success
+        return await self._async_set_function("bell", "bell_on", on)
+
+    @callback
+    def async_set_nowait(self, setter: str, on: bool) -> None:
+        """Schedule an on/off setter without waiting for the BLE write.
+
+        The setter notifies listeners of the new state itself, so callers do
+        not need to await the result.
+        """
+        self.hass.async_create_background_task(
+            getattr(self, setter)(on), f"{DOMAIN} {self.mac_address} {setter}"
+        )
 
     async def async_play_announcement(self, announcement_code: int) -> bool:
         """Play announcement sound."""
-        command = build_simple_command(0x4D, [announcement_code, 0x00])
+        command = build_simple_command(0x4D, bytes((announcement_code, 0x00)))
         return await self.async_send_command(command)
 
     async def async_disconnect(self) -> bool:
         """Disconnect from train."""
-        command = build_simple_command(0x4B, [0x00, 0x00])
-        return await self.async_send_command(command)
+        return await self.async_send_command(DISCONNECT_COMMAND, response=True)
 
     async def async_force_reconnect(self) -> bool:
         """Force reconnection to the train."""
         _LOGGER.info("Force reconnecting to Lionel train at %s", self.mac_address)
         
         # Clear connection state first - don't try to send disconnect commands
-        # since the locomotive might already be disconnected/powered off
-        self._connected = False
-        if self._client:
+        # since the locomotive might already be disconnected/powered off.
+        # Only detach the client under the lock; disconnecting an unresponsive
+        # peer can take seconds and must not hold up other commands.
+        async with self._lock:
+            client = self._client
+            self._client = None
+            self._connected = False
+
+        if client:
             try:
-                if self._client.is_connected:
-                    await self._client.disconnect()
+                if client.is_connected:
+                    await client.disconnect()
                     _LOGGER.debug("Disconnected existing client")
             except Exception as err:
                 _LOGGER.debug("Error disconnecting client (expected if already disconnected): %s", err)
-            finally:
-                self._client = None
         
         # Wait for any existing connections to clear
         await asyncio.sleep(1.0)
         
         # Now try to establish a fresh connection
-        max_attempts = 5
+        max_attempts = len(_RECONNECT_BACKOFF) + 1
         for attempt in range(max_attempts):
             try:
                 _LOGGER.debug("Connection attempt %d/%d", attempt + 1, max_attempts)
-                
-                # Get fresh device reference
-                ble_device = bluetooth.async_ble_device_from_address(
-                    self.hass, self.mac_address, connectable=True
-                )
-                
-                if not ble_device:
-                    if attempt < max_attempts - 1:
-                        wait_time = (attempt + 1) * 1.0  # 1s, 2s, 3s, 4s delays
-                        _LOGGER.debug("Device not found, waiting %s seconds before retry", wait_time)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        raise BleakError(f"Could not find Bluetooth device {self.mac_address}")
-                
-                # Establish fresh connection
-                async with self._lock:
-                    _LOGGER.debug("Establishing connection to %s", self.mac_address)
-                    self._client = await establish_connection(
-                        BleakClientWithServiceCache,
-                        ble_device,
-                        self.mac_address,
-                        max_attempts=3,
-                    )
-                    
-                    # Set up notification handler
-                    try:
-                        await self._client.start_notify(
-                            NOTIFY_CHARACTERISTIC_UUID, self._notification_handler
-                        )
-                    except BleakError:
-                        _LOGGER.debug("Could not set up notifications")
-                    
-                    # Read device information
-                    await self._read_device_info()
-                    
-                    self._connected = True
-                    self._retry_count = 0
-                    _LOGGER.info("Successfully reconnected to train")
-                    
-                    # Notify all entities of the reconnection
-                    self._notify_state_change()
-                    return True
-                    
+                await self._async_connect()
             except BleakError as err:
                 _LOGGER.debug("Connection attempt %d failed: %s", attempt + 1, err)
                 if attempt < max_attempts - 1:
-                    wait_time = (attempt + 1) * 2.0  # 2s, 4s, 6s, 8s delays
+                    wait_time = _RECONNECT_BACKOFF[attempt]
                     _LOGGER.debug("Waiting %s seconds before retry", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     _LOGGER.error("Failed to reconnect after %d attempts: %s", max_attempts, err)
                     return False
+            else:
+                _LOGGER.info("Successfully reconnected to train")
+
+                # Notify all entities of the reconnection
+                self._notify_state_change()
+                return True
                     
         return False
 
@@ -683,11 +1069,10 @@ class LionelTrainCoordinator:
         if not 0 <= volume <= 7:
             raise ValueError("Volume must be between 0 and 7")
         
-        command = build_simple_command(CMD_MASTER_VOLUME, [volume])
+        command = build_simple_command(CMD_MASTER_VOLUME, bytes((volume,)))
         success = await self.async_send_command(command)
         if success:
-            self._master_volume = volume
-            self._notify_state_change()
+            self._update_and_notify("master_volume", volume)
         return success
 
     async def async_set_sound_volume(self, sound_source: int, volume: int, pitch: int = None) -> bool:
@@ -699,39 +1084,28 @@ class LionelTrainCoordinator:
         
         # Use simple command for better compatibility
         if pitch is not None:
-            command = build_simple_command(CMD_SOUND_VOLUME, [sound_source, volume, pitch & 0xFF])
+            command = build_simple_command(CMD_SOUND_VOLUME, bytes((sound_source, volume, pitch & 0xFF)))
         else:
-            command = build_simple_command(CMD_SOUND_VOLUME, [sound_source, volume])
+            command = build_simple_command(CMD_SOUND_VOLUME, bytes((sound_source, volume)))
         
         success = await self.async_send_command(command)
         
         if success:
             # Update state tracking based on sound source
-            if sound_source == SOUND_SOURCE_HORN:
-                self._horn_volume = volume
-                if pitch is not None:
-                    self._horn_pitch = pitch
-            elif sound_source == SOUND_SOURCE_BELL:
-                self._bell_volume = volume
-                if pitch is not None:
-                    self._bell_pitch = pitch
-            elif sound_source == SOUND_SOURCE_SPEECH:
-                self._speech_volume = volume
+            attrs = self._SOUND_ATTRS.get(sound_source)
+            if attrs is not None:
+                volume_attr, pitch_attr = attrs
                 if pitch is not None:
-                    self._speech_pitch = pitch
-            elif sound_source == SOUND_SOURCE_ENGINE:
-                self._engine_volume = volume
-                if pitch is not None:
-                    self._engine_pitch = pitch
-            
-            self._notify_state_change()
+                    setattr(self, pitch_attr, pitch)
+                self._update_and_notify(volume_attr, volume)
         return success
 
     async def async_set_smoke(self, on: bool) -> bool:
         """Set smoke unit on/off."""
-        command = build_simple_command(CMD_SMOKE, [0x01 if on else 0x00])
-        success = await self.async_send_command(command)
-        if success:
-            self._smoke_on = on
-            self._notify_state_change()
-        return success
+        return await self._async_set_function("smoke", "smoke_on", on)
+
+
+# Notification prefix -> (minimum length, parser)
+_NOTIFY_PARSERS: dict[bytes, tuple[int, Callable[[LionelTrainCoordinator, memoryview], None]]] = {
+    b"\x00\x81\x02": (8, LionelTrainCoordinator._parse_status),
+}
@@ -1,21 +1,24 @@
 """Binary sensor platform for Lionel Train Controller integration."""
 from __future__ import annotations
 
-import logging
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LionelTrainCoordinator
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
+CONNECTION_DESCRIPTION = BinarySensorEntityDescription(
+    key="connection",
+    name="Connection",
+    device_class=BinarySensorDeviceClass.CONNECTIVITY,
+)
 
 
 async def async_setup_entry(
@@ -27,38 +30,34 @@ async def async_setup_entry(
     coordinator: LionelTrainCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data[CONF_NAME]
     
-    async_add_entities([LionelTrainConnectionSensor(coordinator, name)], True)
+    async_add_entities([LionelTrainConnectionSensor(coordinator, name)])
 
 
 class LionelTrainConnectionSensor(BinarySensorEntity):
     """Binary sensor for Lionel Train connection status."""
 
     _attr_has_entity_name = True
-    _attr_name = "Connection"
-    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_should_poll = False
+    entity_description = CONNECTION_DESCRIPTION
 
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the binary sensor."""
         self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_connection"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": device_name,
-            **coordinator.device_info,
-        }
-        # Register for state updates
-        self._coordinator.add_update_callback(self.async_write_ha_state)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Entity being removed from hass."""
-        self._coordinator.remove_update_callback(self.async_write_ha_state)
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the train is connected."""
-        return self._coordinator.connected
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True  # This sensor is always available to show connection status
\ No newline at end of file
+        self._attr_unique_id = coordinator.unique_id(self.entity_description.key)
+        self._attr_device_info = coordinator.shared_device_info
+        # Never marked unavailable so it can show a lost connection
+        self._attr_is_on = coordinator.connected
+
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._async_handle_update, ("connected",)
+            )
+        )
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a connection state change."""
+        self._attr_is_on = self._coordinator.connected
+        self.async_write_ha_state()
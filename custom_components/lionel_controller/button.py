@@ -1,8 +1,6 @@
 """Button platform for Lionel Train Controller integration."""
 from __future__ import annotations
 
-import logging
-
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
@@ -12,8 +10,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import LionelTrainCoordinator
 from .const import ANNOUNCEMENTS, DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,7 +33,7 @@ async def async_setup_entry(
             LionelTrainAnnouncementButton(coordinator, name, announcement_name)
         )
     
-    async_add_entities(buttons, True)
+    async_add_entities(buttons)
 
 
 class LionelTrainButtonBase(ButtonEntity):
@@ -48,16 +44,12 @@ class LionelTrainButtonBase(ButtonEntity):
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the button."""
         self._coordinator = coordinator
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": device_name,
-            **coordinator.device_info,
-        }
+        self._attr_device_info = coordinator.shared_device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._coordinator.connected
+        return self._coordinator.available
 
 
 class LionelTrainDisconnectButton(LionelTrainButtonBase):
@@ -69,7 +61,7 @@ class LionelTrainDisconnectButton(LionelTrainButtonBase):
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the disconnect button."""
         super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_disconnect"
+        self._attr_unique_id = coordinator.unique_id("disconnect")
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -85,7 +77,7 @@ class LionelTrainStopButton(LionelTrainButtonBase):
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the stop button."""
         super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_stop"
+        self._attr_unique_id = coordinator.unique_id("stop")
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -101,7 +93,7 @@ class LionelTrainForwardButton(LionelTrainButtonBase):
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the forward button."""
         super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_forward"
+        self._attr_unique_id = coordinator.unique_id("forward")
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -117,7 +109,7 @@ class LionelTrainReverseButton(LionelTrainButtonBase):
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the reverse button."""
         super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_reverse"
+        self._attr_unique_id = coordinator.unique_id("reverse")
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -136,7 +128,7 @@ class LionelTrainAnnouncementButton(LionelTrainButtonBase):
         super().__init__(coordinator, device_name)
         self._announcement_name = announcement_name
         self._attr_name = f"Announcement {announcement_name}"
-        self._attr_unique_id = f"{coordinator.mac_address}_announcement_{announcement_name.lower().replace(' ', '_')}"
+        self._attr_unique_id = coordinator.unique_id(f"announcement_{announcement_name.lower().replace(' ', '_')}")
 
     async def async_press(self) -> None:
         """Press the button."""
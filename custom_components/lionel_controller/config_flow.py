@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
-from bleak import BleakScanner
-from bleak.exc import BleakError
 from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
@@ -25,6 +24,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAC_RE = re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+_LIONCHIEF_UUIDS = frozenset({DEFAULT_SERVICE_UUID.lower()})
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_MAC_ADDRESS): str,
@@ -45,21 +47,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not _is_valid_mac_address(mac_address):
         raise InvalidMacAddress
 
-    # Try to discover the device
-    try:
-        scanner = BleakScanner()
-        devices = await scanner.discover(timeout=10.0)
-        
-        device_found = any(
-            device.address.upper() == mac_address.upper() for device in devices
+    # Look the device up in Home Assistant's shared Bluetooth scanner cache
+    if (
+        bluetooth.async_ble_device_from_address(
+            hass, mac_address.upper(), connectable=True
         )
-        
-        if not device_found:
-            raise CannotConnect
-            
-    except BleakError as err:
-        _LOGGER.exception("Error discovering Bluetooth devices")
-        raise CannotConnect from err
+        is None
+    ):
+        raise CannotConnect
 
     # Return info that you want to store in the config entry.
     return {
@@ -71,19 +66,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
 def _is_valid_mac_address(mac: str) -> bool:
     """Check if MAC address is valid."""
-    parts = mac.split(":")
-    if len(parts) != 6:
-        return False
-    
-    for part in parts:
-        if len(part) != 2:
-            return False
-        try:
-            int(part, 16)
-        except ValueError:
-            return False
-    
-    return True
+    return _MAC_RE.fullmatch(mac) is not None
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -134,13 +117,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._abort_if_unique_id_configured()
 
         # Check if this is a Lionel train by service UUID
-        lionel_service_found = False
-        for service_uuid in discovery_info.service_uuids:
-            if service_uuid.lower() == DEFAULT_SERVICE_UUID.lower():
-                lionel_service_found = True
-                break
-        
-        if not lionel_service_found:
+        if _LIONCHIEF_UUIDS.isdisjoint(
+            service_uuid.lower() for service_uuid in discovery_info.service_uuids
+        ):
             return self.async_abort(reason="not_lionel_device")
 
         self._discovered_devices[discovery_info.address] = discovery_info
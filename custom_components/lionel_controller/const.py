@@ -66,6 +66,15 @@ DEFAULT_NAME = "Lionel Train"
 DEFAULT_TIMEOUT = 10.0
 DEFAULT_RETRY_COUNT = 3
 
+# Seconds without commands before the BLE link is released
+IDLE_DISCONNECT_TIMEOUT = 30.0
+
+# Minimum seconds between state writes of notification-driven entities
+STATE_WRITE_COOLDOWN = 0.1
+
+# Persistent cache of device information strings
+STORAGE_VERSION = 1
+
 # Enhanced announcement sounds with proper command structure
 ANNOUNCEMENTS = {
     "Random": {"code": 0x00, "name": "Random"},
@@ -78,11 +87,8 @@ ANNOUNCEMENTS = {
 }
 
 # Command building helper functions
-def calculate_checksum(command_code: int, parameters: list[int] = None) -> int:
+def calculate_checksum(command_code: int, parameters: bytes = b"") -> int:
     """Calculate proper Lionel checksum based on protocol."""
-    if parameters is None:
-        parameters = []
-    
     # Checksum calculation: 0xFF - command - sum(parameters)
     checksum = 0xFF - command_code
     for param in parameters:
@@ -90,36 +96,53 @@ def calculate_checksum(command_code: int, parameters: list[int] = None) -> int:
     
     return checksum
 
-def build_command(command_code: int, parameters: list[int] = None) -> list[int]:
+def build_command(command_code: int, parameters: bytes = b"") -> bytes:
     """Build a properly formatted Lionel command with correct checksum."""
-    if parameters is None:
-        parameters = []
-    
     # Enhanced command structure: [0x00, command, param1, param2, ..., checksum]
-    command = [CMD_ZERO_BYTE, command_code] + parameters
-    
-    # Add proper checksum
-    checksum = calculate_checksum(command_code, parameters)
-    command.append(checksum)
-    
-    return command
-
-def build_simple_command(command_code: int, parameters: list[int] = None) -> list[int]:
+    return bytes(
+        (
+            CMD_ZERO_BYTE,
+            command_code,
+            *parameters,
+            calculate_checksum(command_code, parameters),
+        )
+    )
+
+def build_simple_command(command_code: int, parameters: bytes = b"") -> bytes:
     """Build a simple Lionel command without checksum for basic compatibility."""
-    if parameters is None:
-        parameters = []
-    
     # Simple command structure: [0x00, command, param1, param2, ...]
     # No checksum for maximum compatibility
-    command = [CMD_ZERO_BYTE, command_code] + parameters
-    
-    return command
+    return bytes((CMD_ZERO_BYTE, command_code, *parameters))
 
-def build_volume_command(sound_source: int, volume: int, pitch: int = None) -> list[int]:
+def build_volume_command(sound_source: int, volume: int, pitch: int = None) -> bytes:
     """Build volume/pitch command for specific sound source."""
     if pitch is not None:
         # Clamp pitch to valid range
         pitch = max(PITCH_MIN, min(PITCH_MAX, pitch))
-        return build_command(CMD_SOUND_VOLUME, [sound_source, volume, pitch & 0xFF])
+        return build_command(CMD_SOUND_VOLUME, bytes((sound_source, volume, pitch & 0xFF)))
     else:
-        return build_command(CMD_SOUND_VOLUME, [sound_source, volume])
\ No newline at end of file
+        return build_command(CMD_SOUND_VOLUME, bytes((sound_source, volume)))
+
+
+# Precomputed payloads for commands that only take an on/off style value
+COMMANDS: dict[tuple[str, bool], bytes] = {
+    ("lights", True): build_simple_command(CMD_LIGHTS, b"\x01"),
+    ("lights", False): build_simple_command(CMD_LIGHTS, b"\x00"),
+    ("horn", True): build_simple_command(CMD_HORN, b"\x01"),
+    ("horn", False): build_simple_command(CMD_HORN, b"\x00"),
+    ("bell", True): build_simple_command(CMD_BELL, b"\x01"),
+    ("bell", False): build_simple_command(CMD_BELL, b"\x00"),
+    ("smoke", True): build_simple_command(CMD_SMOKE, b"\x01"),
+    ("smoke", False): build_simple_command(CMD_SMOKE, b"\x00"),
+    ("direction", True): build_simple_command(CMD_DIRECTION, bytes((DIRECTION_FORWARD,))),
+    ("direction", False): build_simple_command(CMD_DIRECTION, bytes((DIRECTION_REVERSE,))),
+}
+DISCONNECT_COMMAND = build_simple_command(CMD_DISCONNECT, b"\x00\x00")
+
+# Hex speed (0-31) for every throttle percentage (0-100)
+SPEED_HEX: tuple[int, ...] = tuple((speed * 31) // 100 for speed in range(101))
+
+# Speed command for every throttle percentage
+SPEED_COMMANDS: tuple[bytes, ...] = tuple(
+    build_simple_command(CMD_SPEED, bytes((hex_speed,))) for hex_speed in SPEED_HEX
+)
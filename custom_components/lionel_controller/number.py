@@ -1,21 +1,93 @@
 """Number platform for Lionel Train Controller integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
-from typing import Any
 
-from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.components.number import (
+    NumberEntity,
+    NumberEntityDescription,
+    NumberMode,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LionelTrainCoordinator
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SOUND_SOURCE_BELL,
+    SOUND_SOURCE_ENGINE,
+    SOUND_SOURCE_HORN,
+    SOUND_SOURCE_SPEECH,
+    STATE_WRITE_COOLDOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class LionelNumberEntityDescription(NumberEntityDescription):
+    """Describes a Lionel Train number."""
+
+    state_attr: str
+    sound_source: int | None = None
+    mode: NumberMode = NumberMode.SLIDER
+    native_min_value: float = 0
+    native_max_value: float = 7
+    native_step: float = 1
+
+
+THROTTLE_DESCRIPTION = LionelNumberEntityDescription(
+    key="throttle",
+    name="Throttle",
+    icon="mdi:train",
+    native_max_value=100,
+    native_unit_of_measurement="%",
+    state_attr="speed",
+)
+
+MASTER_VOLUME_DESCRIPTION = LionelNumberEntityDescription(
+    key="master_volume",
+    name="Master Volume",
+    icon="mdi:volume-high",
+    state_attr="master_volume",
+)
+
+SOUND_VOLUME_DESCRIPTIONS: tuple[LionelNumberEntityDescription, ...] = (
+    LionelNumberEntityDescription(
+        key="horn_volume",
+        name="Horn Volume",
+        icon="mdi:bullhorn",
+        state_attr="horn_volume",
+        sound_source=SOUND_SOURCE_HORN,
+    ),
+    LionelNumberEntityDescription(
+        key="bell_volume",
+        name="Bell Volume",
+        icon="mdi:bell",
+        state_attr="bell_volume",
+        sound_source=SOUND_SOURCE_BELL,
+    ),
+    LionelNumberEntityDescription(
+        key="speech_volume",
+        name="Speech Volume",
+        icon="mdi:account-voice",
+        state_attr="speech_volume",
+        sound_source=SOUND_SOURCE_SPEECH,
+    ),
+    LionelNumberEntityDescription(
+        key="engine_volume",
+        name="Engine Volume",
+        icon="mdi:train",
+        state_attr="engine_volume",
+        sound_source=SOUND_SOURCE_ENGINE,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -24,245 +96,98 @@ async def async_setup_entry(
     """Set up the Lionel Train number platform."""
     coordinator: LionelTrainCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data[CONF_NAME]
-    
+
     async_add_entities([
-        LionelTrainThrottle(coordinator, name),
-        LionelTrainMasterVolume(coordinator, name),
-        LionelTrainHornVolume(coordinator, name),
-        LionelTrainBellVolume(coordinator, name),
-        LionelTrainSpeechVolume(coordinator, name),
-        LionelTrainEngineVolume(coordinator, name),
-    ], True)
+        LionelTrainThrottle(coordinator, name, THROTTLE_DESCRIPTION),
+        LionelTrainMasterVolume(coordinator, name, MASTER_VOLUME_DESCRIPTION),
+        *(
+            LionelTrainSoundVolume(coordinator, name, description)
+            for description in SOUND_VOLUME_DESCRIPTIONS
+        ),
+    ])
 
 
-class LionelTrainThrottle(NumberEntity):
-    """Representation of a Lionel Train throttle as a number entity."""
+class LionelTrainNumber(NumberEntity):
+    """Base class for Lionel Train numbers backed by one state attribute."""
 
     _attr_has_entity_name = True
-    _attr_name = "Throttle"
-    _attr_icon = "mdi:train"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 100
-    _attr_native_step = 1
-    _attr_native_unit_of_measurement = "%"
-
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
+    _attr_should_poll = False
+    entity_description: LionelNumberEntityDescription
+
+    def __init__(
+        self,
+        coordinator: LionelTrainCoordinator,
+        name: str,
+        description: LionelNumberEntityDescription,
+    ) -> None:
         """Initialize the number entity."""
         self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_throttle"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
-        # Register for state updates
-        self._coordinator.add_update_callback(self.async_write_ha_state)
+        self.entity_description = description
+        self._attr_unique_id = coordinator.unique_id(description.key)
+        self._attr_device_info = coordinator.shared_device_info
+        self._update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._async_handle_update,
+                (self.entity_description.state_attr, "connected"),
+            )
+        )
+
+    def _update_attrs(self) -> None:
+        """Copy the coordinator state into the entity attributes."""
+        self._attr_available = self._coordinator.available
+        self._attr_native_value = getattr(
+            self._coordinator.state, self.entity_description.state_attr
+        )
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a coordinator state change."""
+        self._update_attrs()
+        self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Entity being removed from hass."""
-        self._coordinator.remove_update_callback(self.async_write_ha_state)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
+class LionelTrainThrottle(LionelTrainNumber):
+    """Representation of a Lionel Train throttle as a number entity."""
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current throttle value."""
-        return self._coordinator.speed
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        # Collapse bursts of status notifications into a single state write
+        debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN,
+            immediate=True,
+            function=self._async_handle_update,
+        )
+        self.async_on_remove(debouncer.async_shutdown)
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                debouncer.async_schedule_call, ("speed", "connected")
+            )
+        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the throttle value."""
         await self._coordinator.async_set_speed(int(value))
-        self.async_write_ha_state()
 
 
-class LionelTrainMasterVolume(NumberEntity):
-    """Representation of master volume control."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Master Volume"
-    _attr_icon = "mdi:volume-high"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 7
-    _attr_native_step = 1
+class LionelTrainSoundVolume(LionelTrainNumber):
+    """Representation of the volume of one sound source."""
 
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
-        """Initialize the number entity."""
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_master_volume"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the sound source volume."""
+        await self._coordinator.async_set_sound_volume(
+            self.entity_description.sound_source, int(value)
+        )
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current master volume."""
-        return self._coordinator.master_volume
+class LionelTrainMasterVolume(LionelTrainSoundVolume):
+    """Representation of master volume control."""
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the master volume."""
         await self._coordinator.async_set_master_volume(int(value))
-        self.async_write_ha_state()
-
-
-class LionelTrainHornVolume(NumberEntity):
-    """Representation of horn volume control."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Horn Volume"
-    _attr_icon = "mdi:bullhorn"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 7
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
-        """Initialize the number entity."""
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_horn_volume"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current horn volume."""
-        return self._coordinator.horn_volume
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the horn volume."""
-        from .const import SOUND_SOURCE_HORN
-        await self._coordinator.async_set_sound_volume(SOUND_SOURCE_HORN, int(value))
-        self.async_write_ha_state()
-
-
-class LionelTrainBellVolume(NumberEntity):
-    """Representation of bell volume control."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Bell Volume"
-    _attr_icon = "mdi:bell"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 7
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
-        """Initialize the number entity."""
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_bell_volume"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current bell volume."""
-        return self._coordinator.bell_volume
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the bell volume."""
-        from .const import SOUND_SOURCE_BELL
-        await self._coordinator.async_set_sound_volume(SOUND_SOURCE_BELL, int(value))
-        self.async_write_ha_state()
-
-
-class LionelTrainSpeechVolume(NumberEntity):
-    """Representation of speech volume control."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Speech Volume"
-    _attr_icon = "mdi:account-voice"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 7
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
-        """Initialize the number entity."""
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_speech_volume"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current speech volume."""
-        return self._coordinator.speech_volume
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the speech volume."""
-        from .const import SOUND_SOURCE_SPEECH
-        await self._coordinator.async_set_sound_volume(SOUND_SOURCE_SPEECH, int(value))
-        self.async_write_ha_state()
-
-
-class LionelTrainEngineVolume(NumberEntity):
-    """Representation of engine volume control."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Engine Volume"
-    _attr_icon = "mdi:train"
-    _attr_mode = NumberMode.SLIDER
-    _attr_native_min_value = 0
-    _attr_native_max_value = 7
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: LionelTrainCoordinator, name: str) -> None:
-        """Initialize the number entity."""
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_engine_volume"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": name,
-            **coordinator.device_info,
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current engine volume."""
-        return self._coordinator.engine_volume
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the engine volume."""
-        from .const import SOUND_SOURCE_ENGINE
-        await self._coordinator.async_set_sound_volume(SOUND_SOURCE_ENGINE, int(value))
-        self.async_write_ha_state()
\ No newline at end of file
@@ -2,18 +2,26 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import LionelTrainCoordinator
-from .const import DOMAIN
+from . import LionelTrainCoordinator, TrainState
+from .const import DOMAIN, STATE_WRITE_COOLDOWN
 
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_DESCRIPTION = SensorEntityDescription(
+    key="status",
+    name="Status",
+    icon="mdi:train",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,52 +32,77 @@ async def async_setup_entry(
     coordinator: LionelTrainCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data[CONF_NAME]
     
-    async_add_entities([LionelTrainStatusSensor(coordinator, name)], True)
+    async_add_entities([LionelTrainStatusSensor(coordinator, name)])
 
 
 class LionelTrainStatusSensor(SensorEntity):
     """Sensor for Lionel Train status information."""
 
     _attr_has_entity_name = True
-    _attr_name = "Status"
-    _attr_icon = "mdi:train"
+    _attr_should_poll = False
+    entity_description = STATUS_DESCRIPTION
 
     def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
         """Initialize the sensor."""
         self._coordinator = coordinator
-        self._attr_unique_id = f"{coordinator.mac_address}_status"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": device_name,
-            **coordinator.device_info,
-        }
-        # Register for state updates
-        self._coordinator.add_update_callback(self.async_write_ha_state)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Entity being removed from hass."""
-        self._coordinator.remove_update_callback(self.async_write_ha_state)
+        self._attr_unique_id = coordinator.unique_id(self.entity_description.key)
+        self._attr_device_info = coordinator.shared_device_info
+        # Attributes are rebuilt only when the coordinator publishes a new state
+        self._attrs_state: TrainState | None = None
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        hex_value = self._coordinator.last_notification_hex
-        if hex_value is None:
-            return "No data"
-        return hex_value
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        # Collapse bursts of status notifications into a single state write
+        debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN,
+            immediate=True,
+            function=self._async_handle_update,
+        )
+        self.async_on_remove(debouncer.async_shutdown)
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                debouncer.async_schedule_call,
+                (
+                    "last_notification_hex",
+                    "speed",
+                    "direction_forward",
+                    "lights_on",
+                    "bell_on",
+                    "horn_on",
+                    "connected",
+                ),
+            )
+        )
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
+    def _update_attrs(self) -> None:
+        """Copy the coordinator state into the entity attributes."""
+        self._attr_available = self._coordinator.available
+        state = self._coordinator.state
+        if self._coordinator.idle_released:
+            # No notifications arrive while the link is released, so the last
+            # frame may no longer match the train
+            self._attr_native_value = None
+        else:
+            hex_value = state.last_notification_hex
+            self._attr_native_value = "No data" if hex_value is None else hex_value
+        if state is self._attrs_state:
+            return
+        self._attrs_state = state
+        self._attr_extra_state_attributes = MappingProxyType(
+            {
+                "speed": state.speed,
+                "direction_forward": state.direction_forward,
+                "lights_on": state.lights_on,
+                "bell_on": state.bell_on,
+                "horn_on": state.horn_on,
+            }
+        )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return additional state attributes."""
-        return {
-            "speed": self._coordinator.speed,
-            "direction_forward": self._coordinator.direction_forward,
-            "lights_on": self._coordinator.lights_on,
-            "bell_on": self._coordinator.bell_on,
-            "horn_on": self._coordinator.horn_on,
-        }
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a coordinator state change."""
+        self._update_attrs()
+        self.async_write_ha_state()
@@ -1,19 +1,50 @@
 """Switch platform for Lionel Train Controller integration."""
 from __future__ import annotations
 
-import logging
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LionelTrainCoordinator
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
+
+@dataclass(frozen=True, kw_only=True)
+class LionelSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Lionel Train switch."""
+
+    state_attr: str
+    setter: str
+
+
+SWITCH_DESCRIPTIONS: tuple[LionelSwitchEntityDescription, ...] = (
+    LionelSwitchEntityDescription(
+        key="lights",
+        name="Lights",
+        icon="mdi:lightbulb",
+        state_attr="lights_on",
+        setter="async_set_lights",
+    ),
+    LionelSwitchEntityDescription(
+        key="horn",
+        name="Horn",
+        icon="mdi:bullhorn",
+        state_attr="horn_on",
+        setter="async_set_horn",
+    ),
+    LionelSwitchEntityDescription(
+        key="bell",
+        name="Bell",
+        icon="mdi:bell",
+        state_attr="bell_on",
+        setter="async_set_bell",
+    ),
+)
 
 
 async def async_setup_entry(
@@ -24,112 +55,59 @@ async def async_setup_entry(
     """Set up the Lionel Train switch platform."""
     coordinator: LionelTrainCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data[CONF_NAME]
-    
-    switches = [
-        LionelTrainLightsSwitch(coordinator, name),
-        LionelTrainHornSwitch(coordinator, name),
-        LionelTrainBellSwitch(coordinator, name),
-    ]
-    
-    async_add_entities(switches, True)
 
+    async_add_entities(
+        LionelTrainSwitch(coordinator, name, description)
+        for description in SWITCH_DESCRIPTIONS
+    )
 
-class LionelTrainSwitchBase(SwitchEntity):
-    """Base class for Lionel Train switches."""
 
-    _attr_has_entity_name = True
+class LionelTrainSwitch(SwitchEntity):
+    """Switch for a single on/off train function."""
 
-    def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description: LionelSwitchEntityDescription
+
+    def __init__(
+        self,
+        coordinator: LionelTrainCoordinator,
+        device_name: str,
+        description: LionelSwitchEntityDescription,
+    ) -> None:
         """Initialize the switch."""
         self._coordinator = coordinator
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.mac_address)},
-            "name": device_name,
-            **coordinator.device_info,
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._coordinator.connected
-
-
-class LionelTrainLightsSwitch(LionelTrainSwitchBase):
-    """Switch for controlling train lights."""
-
-    _attr_name = "Lights"
-    _attr_icon = "mdi:lightbulb"
-
-    def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
-        """Initialize the lights switch."""
-        super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_lights"
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the lights are on."""
-        return self._coordinator.lights_on
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the lights."""
-        await self._coordinator.async_set_lights(True)
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the lights."""
-        await self._coordinator.async_set_lights(False)
-        self.async_write_ha_state()
-
-
-class LionelTrainHornSwitch(LionelTrainSwitchBase):
-    """Switch for controlling train horn."""
-
-    _attr_name = "Horn"
-    _attr_icon = "mdi:bullhorn"
-
-    def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
-        """Initialize the horn switch."""
-        super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_horn"
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the horn is on."""
-        return self._coordinator.horn_on
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the horn."""
-        await self._coordinator.async_set_horn(True)
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the horn."""
-        await self._coordinator.async_set_horn(False)
+        self.entity_description = description
+        self._attr_unique_id = coordinator.unique_id(description.key)
+        self._attr_device_info = coordinator.shared_device_info
+        self._update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._async_handle_update,
+                (self.entity_description.state_attr, "connected"),
+            )
+        )
+
+    def _update_attrs(self) -> None:
+        """Copy the coordinator state into the entity attributes."""
+        self._attr_available = self._coordinator.available
+        self._attr_is_on = getattr(
+            self._coordinator.state, self.entity_description.state_attr
+        )
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a coordinator state change."""
+        self._update_attrs()
         self.async_write_ha_state()
 
-
-class LionelTrainBellSwitch(LionelTrainSwitchBase):
-    """Switch for controlling train bell."""
-
-    _attr_name = "Bell"
-    _attr_icon = "mdi:bell"
-
-    def __init__(self, coordinator: LionelTrainCoordinator, device_name: str) -> None:
-        """Initialize the bell switch."""
-        super().__init__(coordinator, device_name)
-        self._attr_unique_id = f"{coordinator.mac_address}_bell"
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the bell is on."""
-        return self._coordinator.bell_on
-
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the bell."""
-        await self._coordinator.async_set_bell(True)
-        self.async_write_ha_state()
+        """Turn the function on."""
+        self._coordinator.async_set_nowait(self.entity_description.setter, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the bell."""
-        await self._coordinator.async_set_bell(False)
-        self.async_write_ha_state()
+        """Turn the function off."""
+        self._coordinator.async_set_nowait(self.entity_description.setter, False)